@@ -15,14 +15,12 @@ Requisitos (uma vez só):
 sudo apt update
 sudo apt install -y alsa-utils tesseract-ocr \
                     tesseract-ocr-por tesseract-ocr-eng \
-                    python3-rpi.gpio iw sox
+                    pigpio iw sox libturbojpeg0
+sudo systemctl enable --now pigpiod
 python3 -m venv ~/venvs/ai
 source ~/venvs/ai/bin/activate
-pip install --upgrade openai opencv-python numpy pytesseract requests
+pip install --upgrade openai opencv-python numpy pytesseract aiohttp pigpio PyTurboJPEG
 echo 'export OPENAI_API_KEY="sk-…"' >> ~/.bashrc
-
-Adicione seu usuário ao grupo ‘gpio’ e faça logout/login:
-sudo usermod -aG gpio $USER
 ──────────────────────────
 Ligação da chave
 • BCM 22 (pino fís. 15)  → comum  
@@ -34,166 +32,382 @@ source ~/venvs/ai/bin/activate
 python ~/capture_describe.py
 """
 
-import os, base64, subprocess, cv2, pytesseract, tempfile, time, signal, re, json
-import RPi.GPIO as GPIO
-import requests
-from openai import OpenAI
+import os, io, subprocess, time, signal, re, json, asyncio, threading, functools
+from concurrent.futures import ProcessPoolExecutor
+import pigpio
+import aiohttp
 
 # ╔═ IA / ÁUDIO / CÂMERA ════════════════════════════════════════════════
 DEVICE  = "/dev/v4l/by-id/usb-ICT-TEK_HD_Camera_202001010001-video-index0"
 WIDTH, HEIGHT, FOURCC = 1280, 720, "MJPG"
+FPS = 15   # menos banda isócrona USB; 15 fps basta p/ foto sob demanda
+MAX_SIDE, JPEG_Q = 1024, 75   # a API reduz p/ ~768 px de qualquer jeito; menos bytes no upload
 MODEL_TEXT = "gpt-4o"
 MODEL_TTS  = "tts-1"
 VOICE      = "alloy"
 ROTATE_180 = False
 
-# ╔═ GPIO POLLING ═══════════════════════════════════════════════════════
+# ╔═ GPIO (pigpio, edge-driven) ═════════════════════════════════════════
 PIN_TOGGLE   = 22      # BCM 22 (fís. 15)
-POLL_MS      = 40
-DEBOUNCE_MS  = 200
+DEBOUNCE_MS  = 200     # glitch filter (debounce no kernel, não em Python)
+BATCH_S      = 1.5     # janela p/ agrupar toggles seguidos numa chamada só
 
 # ╔═ PROMPTS ════════════════════════════════════════════════════════════
+# Descrição + OCR numa única chamada: resposta JSON estruturada elimina a
+# segunda ida ao GPT-4o (~1–3 s e o dobro do custo) quando há texto na cena.
 PROMPT_DESC = (
-    "Descreva em português o que aparece na imagem. "
-    "Se houver texto legível, acrescente a linha isolada TEXTO_PRESENTE=SIM, "
-    "caso contrário TEXTO_PRESENTE=NAO."
+    "Analise a imagem e responda em JSON com as chaves: "
+    '"descricao" (descrição em português do que aparece), '
+    '"texto_presente" (true se houver texto legível, senão false) e '
+    '"texto" (todo o texto legível transcrito, ou "" se não houver).'
 )
-PROMPT_OCR = (
-    "Extraia todo o texto legível da imagem. "
-    "Se não houver texto, responda apenas SEM_TEXTO."
+PROMPT_DESC_MULTI = (
+    "Analise as imagens (fotos tiradas em sequência) e responda em JSON com as chaves: "
+    '"descricao" (descrição em português de cada imagem, na ordem), '
+    '"texto_presente" (true se houver texto legível em alguma, senão false) e '
+    '"texto" (todo o texto legível transcrito, na ordem das imagens, ou "" se não houver).'
 )
 
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Cliente OpenAI e libs pesadas (cv2, pytesseract) são importados sob demanda:
+# o import frio de cv2+numpy+openai custa 2–4 s de page faults no Pi.
+@functools.cache
+def get_client():
+    from openai import AsyncOpenAI
+    return AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+# Sessão HTTP persistente (keep-alive): evita um handshake TLS de 200–400 ms
+# por host a cada toggle. Criada em main(), reusada por MLS/IPinfo/Nominatim.
+http = None
+
+def make_http():
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=4),
+        headers={"User-Agent": "rpi-cam/1.0"})
+
+cap     = None   # VideoCapture persistente (aberto uma vez em main)
+grabber = None   # thread que mantém sempre o frame mais recente
+
+class FrameGrabber(threading.Thread):
+    """Lê frames continuamente num buffer de 1 posição — o toggle nunca
+    espera cap.read(): copia o último frame já capturado."""
+    def __init__(self, cap):
+        super().__init__(daemon=True)
+        self.cap = cap; self.latest = None
+        self.lock = threading.Lock(); self.stopped = False
+    def run(self):
+        while not self.stopped:
+            ok, f = self.cap.read()
+            if ok:
+                with self.lock: self.latest = f
+    def read(self):
+        with self.lock:
+            return None if self.latest is None else self.latest.copy()
+    def stop(self):
+        self.stopped = True
 
 # ╔═ FUNÇÕES BÁSICAS ════════════════════════════════════════════════════
-def tts_play(text: str):
-    wav = client.audio.speech.create(
+async def tts_play(text: str):
+    # WAV direto no stdin do aplay: sem tempfile no SD e o áudio começa
+    # a tocar no primeiro chunk, antes da síntese terminar.
+    p = await asyncio.create_subprocess_exec(
+        "aplay", "-q", "-D", "plughw:2,0", stdin=asyncio.subprocess.PIPE)
+    async with get_client().audio.speech.with_streaming_response.create(
         model=MODEL_TTS, voice=VOICE, input=text, response_format="wav"
-    ).content
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as f:
-        f.write(wav); path = f.name
-    subprocess.run(["aplay", "-q", "-D", "plughw:2,0", path], check=True)
+    ) as resp:
+        async for chunk in resp.iter_bytes(8192):
+            p.stdin.write(chunk); await p.stdin.drain()
+    p.stdin.close()
+    await p.wait()
 
-def capture_jpeg() -> bytes:
+def init_camera():
+    """Abre a câmera uma única vez — reabrir o V4L2 custa 1–3 s por disparo."""
+    global cap, grabber
+    import cv2
     cap = cv2.VideoCapture(DEVICE)
     cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*FOURCC))
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, WIDTH); cap.set(cv2.CAP_PROP_FRAME_HEIGHT, HEIGHT)
-    ok, frame = cap.read(); cap.release()
-    if not ok: raise RuntimeError("Falha na câmera")
-    if ROTATE_180: frame = cv2.rotate(frame, cv2.ROTATE_180)
-    ok, buf = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), 90])
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    cap.set(cv2.CAP_PROP_FPS, FPS)
+    if not cap.isOpened(): raise RuntimeError("Falha ao abrir a câmera")
+    grabber = FrameGrabber(cap); grabber.start()
+    t0 = time.monotonic()                       # espera o primeiro frame chegar
+    while grabber.read() is None:
+        if time.monotonic() - t0 > 5: raise RuntimeError("Câmera não entregou frames")
+        time.sleep(0.05)
+
+# Encoder JPEG: libjpeg-turbo usa SIMD NEON no ARMv8 (DCT + conversão de cor),
+# 2–3× mais rápido que o libjpeg embutido no wheel do OpenCV. Fallback: cv2.
+@functools.cache
+def get_turbojpeg():
+    try:
+        from turbojpeg import TurboJPEG
+        return TurboJPEG()
+    except Exception:
+        return None
+
+def encode_jpeg(frame) -> bytes:
+    tj = get_turbojpeg()
+    if tj is not None:
+        return tj.encode(frame, quality=JPEG_Q)   # pixel_format default = BGR
+    import cv2
+    ok, buf = cv2.imencode(".jpg", frame,
+                           [cv2.IMWRITE_JPEG_QUALITY, JPEG_Q, cv2.IMWRITE_JPEG_OPTIMIZE, 1])
     return buf.tobytes()
 
+# Resize+encode rodam num worker do ProcessPoolExecutor: ~80–150 ms de CPU
+# num core A72 que assim não disputam o loop de eventos nem o GIL.
+exec_pool = None   # criado em main()
+
+def _encode(frame) -> bytes:
+    import cv2
+    if ROTATE_180: frame = cv2.rotate(frame, cv2.ROTATE_180)
+    h, w = frame.shape[:2]; s = MAX_SIDE/max(h, w)
+    if s < 1: frame = cv2.resize(frame, None, fx=s, fy=s, interpolation=cv2.INTER_AREA)
+    return encode_jpeg(frame)
+
+async def capture_jpeg():
+    """Retorna (jpeg, frame): o frame BGR já decodificado segue junto p/ o
+    fallback do Tesseract não precisar redecodificar o JPEG."""
+    frame = grabber.read()
+    if frame is None: raise RuntimeError("Falha na câmera")
+    jpeg = await asyncio.get_running_loop().run_in_executor(exec_pool, _encode, frame)
+    return jpeg, frame
+
 # ╔═ WIFI → LOCALIZAÇÃO ═════════════════════════════════════════════════
+# Um regex só sobre o blob inteiro do `iw scan` (bytes): MAC do BSS + signal.
+# O gap não pode atravessar o próximo "BSS " — um bloco sem linha signal:
+# deve ser pulado, não casado com o signal do bloco seguinte.
+BSS_PAT = re.compile(rb"BSS ([0-9a-f:]{17})(?:(?!\nBSS ).)*?signal:\s*(-\d+)", re.DOTALL)
+
+# O `iw scan` sintoniza canal por canal e leva 1–4 s; em disparos seguidos a
+# posição não mudou, então o resultado vale por WIFI_SCAN_TTL segundos.
+WIFI_SCAN_TTL = 60
+# t=-inf: monotonic() conta desde o boot, e t=0 seria um falso hit (lista
+# vazia) nos primeiros 60 s se o serviço subir junto com o sistema.
+_scan_cache = {"t": float("-inf"), "aps": []}
+
 def scan_wifi():
+    if time.monotonic() - _scan_cache["t"] < WIFI_SCAN_TTL:
+        return _scan_cache["aps"]
     raw = subprocess.check_output(["sudo","iw","dev","wlan0","scan","ap-force"])
-    aps = []
-    for cell in raw.decode(errors="ignore").split("BSS ")[1:]:
-        mac = cell.split()[0]
-        m   = re.search(r"signal:\s*(-\d+)", cell)
-        if mac and m: aps.append({"macAddress":mac,"signalStrength":int(m.group(1))})
-    return aps[:20]
-
-def geo_from_mls():
-    aps = scan_wifi()
+    aps = [{"macAddress": m.group(1).decode(), "signalStrength": int(m.group(2))}
+           for m in BSS_PAT.finditer(raw)][:20]
+    if aps:   # scan vazio (rádio ocupado etc.) não vale o TTL: tenta de novo
+        _scan_cache["t"] = time.monotonic(); _scan_cache["aps"] = aps
+    return aps
+
+async def geo_from_mls():
+    aps = await asyncio.get_running_loop().run_in_executor(None, scan_wifi)
     if not aps: return (None,None,None)
     try:
         url = "https://location.services.mozilla.com/v1/geolocate?key=test"
-        loc = requests.post(url, json={"wifiAccessPoints": aps}, timeout=5).json()
+        async with http.post(url, json={"wifiAccessPoints": aps},
+                             timeout=aiohttp.ClientTimeout(total=5)) as r:
+            loc = await r.json()
         lat = loc["location"]["lat"]; lon = loc["location"]["lng"]
         return (lat, lon, loc.get("accuracy"))
     except Exception as e:
         print("⚠️ MLS:", e); return (None,None,None)
 
-def geo_from_ip():
+async def geo_from_ip():
     try:
-        j  = requests.get("https://ipinfo.io/json", timeout=4).json()
+        async with http.get("https://ipinfo.io/json",
+                            timeout=aiohttp.ClientTimeout(total=4)) as r:
+            j = await r.json()
         lat, lon = j.get("loc","").split(",") if "loc" in j else (None,None)
         return (lat, lon, 50000)
     except Exception as e:
         print("⚠️ IPinfo:", e); return (None,None,None)
 
-def reverse_nominatim(lat, lon):
+# Cache de reverse-geocode — a política de uso do Nominatim exige cache no
+# cliente, e p/ usuário parado vira um lookup de dict em vez de ~400 ms HTTPS.
+# Chave: lat/lon arredondados a 4 casas (~10 m). Persistido entre execuções.
+GEOCACHE_PATH = os.path.expanduser("~/.cache/rpi-cam/nominatim.json")
+try:
+    with open(GEOCACHE_PATH) as _f: _geocache = json.load(_f)
+except Exception:
+    _geocache = {}
+
+def _geocache_save():
+    try:
+        os.makedirs(os.path.dirname(GEOCACHE_PATH), exist_ok=True)
+        with open(GEOCACHE_PATH, "w") as f: json.dump(_geocache, f)
+    except Exception:
+        pass
+
+# Ordem falada: rua, bairro, cidade, estado — cada grupo com seus sinônimos.
+FIELD_FALLBACKS = (("road",), ("suburb","neighbourhood"),
+                   ("city","town","village"), ("state",))
+
+async def reverse_nominatim(lat, lon):
+    if not lat: return ""
+    key = f"{round(float(lat),4)},{round(float(lon),4)}"
+    if key in _geocache: return _geocache[key]
     try:
         url = "https://nominatim.openstreetmap.org/reverse"
         params = {"format":"jsonv2","lat":lat,"lon":lon,"zoom":16}
-        j = requests.get(url, params=params,
-                         headers={"User-Agent":"rpi-cam/1.0"}).json()
+        async with http.get(url, params=params) as r:
+            j = await r.json()
         addr = j.get("address", {})
-        rua   = addr.get("road") or ""
-        bairro= addr.get("suburb") or addr.get("neighbourhood") or ""
-        cidade= addr.get("city") or addr.get("town") or addr.get("village") or ""
-        estado= addr.get("state") or ""
-        return ", ".join(x for x in [rua,bairro,cidade,estado] if x)
+        parts = [next((addr[k] for k in grp if addr.get(k)), "")
+                 for grp in FIELD_FALLBACKS]
+        place = ", ".join(p for p in parts if p)
+        if place: _geocache[key] = place; _geocache_save()
+        return place
     except Exception:
         return ""
 
 # ╔═ OCR OFFLINE (fallback) ═════════════════════════════════════════════
-def ocr_tesseract(jpeg: bytes):
-    import numpy as np
-    img = cv2.imdecode(np.frombuffer(jpeg,np.uint8), cv2.IMREAD_COLOR)
-    gray= cv2.cvtColor(img,cv2.COLOR_BGR2GRAY)
-    return pytesseract.image_to_string(gray, lang="por+eng").strip()
+# LSTM-only + bloco uniforme de texto: mais rápido e mais preciso no Pi.
+TESS_CFG = "--oem 1 --psm 6 -c tessedit_do_invert=0"
+
+def warm_tesseract():
+    """Puxa os traineddata por+eng (~1,5 s do SD) p/ o page cache do SO antes
+    do primeiro toggle. O pytesseract executa um binário tesseract novo a cada
+    chamada — nada fica residente no processo; o ganho é ler da RAM, não do SD."""
+    import numpy as np, pytesseract
+    pytesseract.image_to_string(np.zeros((32,32), np.uint8),
+                                lang="por+eng", config=TESS_CFG)
+
+def ocr_tesseract(frame):
+    import cv2, pytesseract
+    if ROTATE_180: frame = cv2.rotate(frame, cv2.ROTATE_180)
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    _, bw = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return pytesseract.image_to_string(bw, lang="por+eng", config=TESS_CFG).strip()
 
 # ╔═ PIPELINE P/ CADA TOGGLE ════════════════════════════════════════════
-def process_once():
-    jpeg = capture_jpeg(); b64 = base64.b64encode(jpeg).decode()
+async def upload_jpeg(jpeg: bytes) -> str:
+    """Sobe o JPEG uma vez; descrição e OCR referenciam o mesmo file_id
+    em vez de re-enviar base64 (+33 %) em cada chamada."""
+    up = await get_client().files.create(file=("frame.jpg", io.BytesIO(jpeg)), purpose="vision")
+    return up.id
 
-    desc = client.chat.completions.create(
+def _as_text(v) -> str:
+    """json_object só garante JSON válido, não o schema: o modelo às vezes
+    devolve lista (uma entrada por imagem) ou dict onde pedimos string."""
+    if isinstance(v, list): return "\n".join(_as_text(x) for x in v)
+    if isinstance(v, dict): return "\n".join(_as_text(x) for x in v.values())
+    return "" if v is None else str(v)
+
+async def ask_vision(prompt: str, file_ids: list) -> dict:
+    content = [{"type":"input_text","text":prompt}]
+    content += [{"type":"input_image","file_id":f} for f in file_ids]
+    r = await get_client().responses.create(
         model=MODEL_TEXT,
-        messages=[{"role":"user","content":[
-            {"type":"text","text":PROMPT_DESC},
-            {"type":"image_url","image_url":{"url":f"data:image/jpeg;base64,{b64}"}}]}]
-    ).choices[0].message.content.strip()
+        input=[{"role":"user","content":content}],
+        text={"format":{"type":"json_object"}}
+    )
+    try:
+        d = json.loads(r.output_text)
+        if not isinstance(d, dict): raise ValueError
+        return {"descricao": _as_text(d.get("descricao")).strip(),
+                "texto_presente": bool(d.get("texto_presente")),
+                "texto": _as_text(d.get("texto")).strip()}
+    except ValueError:    # modelo fugiu do formato — trata tudo como descrição
+        return {"descricao": r.output_text.strip(), "texto_presente": False, "texto": ""}
+
+async def locate():
+    """Wi-Fi → MLS → Nominatim (fallback IP). Retorna (place, acc) ou (None, None)."""
+    lat, lon, acc = await geo_from_mls()
+    if not lat: lat, lon, acc = await geo_from_ip()
+    if not lat: return (None, None)
+    place = await reverse_nominatim(lat, lon) or "local não identificado"
+    return (place, acc)
+
+async def capture_shot():
+    """Captura e já dispara o upload em background: a janela de agrupamento
+    corre em paralelo com o envio, não antes dele."""
+    jpeg, frame = await capture_jpeg()
+    return asyncio.create_task(upload_jpeg(jpeg)), frame
+
+async def process_once(shots):
+    fids = list(await asyncio.gather(*[up for up, _ in shots]))
 
+    # descrição e geolocalização em paralelo — ambos são rede, não CPU
+    prompt    = PROMPT_DESC if len(fids) == 1 else PROMPT_DESC_MULTI
+    desc_task = asyncio.create_task(ask_vision(prompt, fids))
+    geo_task  = asyncio.create_task(locate())
+
+    d = await desc_task
+    desc = d.get("descricao", "")
     print("\n📷 DESCRIÇÃO:\n", desc)
-    tts_play(desc)
-
-    # ── texto?
-    if "TEXTO_PRESENTE=SIM" in desc.upper():
-        text = client.chat.completions.create(
-            model=MODEL_TEXT,
-            messages=[{"role":"user","content":[
-                {"type":"text","text":PROMPT_OCR},
-                {"type":"image_url","image_url":{"url":f"data:image/jpeg;base64,{b64}"}}]}]
-        ).choices[0].message.content.strip()
-
-        if text.upper()=="SEM_TEXTO" or len(text)<20:
+    if desc: await tts_play(desc)   # string vazia daria 400 na API de fala
+
+    # ── texto? (já veio na mesma resposta; Tesseract só se vier curto demais)
+    if d.get("texto_presente"):
+        text = (d.get("texto") or "").strip()
+        if len(text) < 20:
             print("⚠️  GPT não leu; Tesseract…")
-            text = ocr_tesseract(jpeg)
+            text = await asyncio.get_running_loop().run_in_executor(
+                None, lambda: "\n".join(
+                    t for t in (ocr_tesseract(f) for _, f in shots) if t))
         if text:
             print("\n📝 TEXTO LIDO:\n", text)
-            tts_play("Lendo o texto encontrado: " + text)
+            await tts_play("Lendo o texto encontrado: " + text)
+
+    for fid in fids:                        # não acumular uploads na conta
+        try: await get_client().files.delete(fid)
+        except Exception: pass
 
-    # ── localização
-    lat, lon, acc = geo_from_mls()
-    if not lat: lat, lon, acc = geo_from_ip()
-    if lat:
-        place = reverse_nominatim(lat, lon) or "local não identificado"
+    # ── localização (já resolvida em paralelo)
+    place, acc = await geo_task
+    if place:
         msg = f"Estamos na região de {place}. Precisão aproximada {int(acc)} metros."
-        print(f"\n📍 {place} (±{acc} m)"); tts_play(msg)
+        print(f"\n📍 {place} (±{acc} m)"); await tts_play(msg)
     else:
         print("\n📍 Localização indisponível.")
 
-# ╔═ LOOP DE POLLING DO GPIO ─═══════════════════════════════════════════
-def main():
-    if not client.api_key: raise SystemExit("Defina OPENAI_API_KEY.")
-    GPIO.setmode(GPIO.BCM); GPIO.setup(PIN_TOGGLE, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-    last = GPIO.input(PIN_TOGGLE); last_t = time.monotonic()
+# ╔═ GPIO EVENT-DRIVEN (pigpio) ═════════════════════════════════════════
+pi = None   # conexão pigpio (aberta em main)
+
+def cleanup():
+    if exec_pool is not None: exec_pool.shutdown(wait=False)
+    if grabber is not None: grabber.stop(); grabber.join(timeout=1)
+    if cap is not None: cap.release()
+    if pi is not None and pi.connected:
+        pi.set_glitch_filter(PIN_TOGGLE, 0); pi.stop()
+
+async def main():
+    global pi, http, exec_pool
+    if not os.getenv("OPENAI_API_KEY"): raise SystemExit("Defina OPENAI_API_KEY.")
+    http = make_http()
+    exec_pool = ProcessPoolExecutor(max_workers=2)
+    pi = pigpio.pi()
+    if not pi.connected:
+        raise SystemExit("pigpiod não está rodando (sudo systemctl start pigpiod).")
+    pi.set_mode(PIN_TOGGLE, pigpio.INPUT)
+    pi.set_pull_up_down(PIN_TOGGLE, pigpio.PUD_UP)
+    pi.set_glitch_filter(PIN_TOGGLE, DEBOUNCE_MS*1000)   # debounce em hardware (µs)
+    init_camera()
+    threading.Thread(target=warm_tesseract, daemon=True).start()
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue()
+    cb = pi.callback(PIN_TOGGLE, pigpio.EITHER_EDGE,
+                     lambda g,l,t: loop.call_soon_threadsafe(events.put_nowait, t))
     print("Pronto! Aguardando chave no GPIO22… Ctrl+C para sair.")
     try:
         while True:
-            time.sleep(POLL_MS/1000)
-            state = GPIO.input(PIN_TOGGLE); now = time.monotonic()
-            if state!=last and (now-last_t)*1000>DEBOUNCE_MS:
-                print("\n🔔 Toggle detectado — iniciando…")
-                process_once(); last_t = now
-            last = state
-    except KeyboardInterrupt:
-        pass
+            await events.get()           # dorme até a borda chegar — zero polling
+            print("\n🔔 Toggle detectado — iniciando…")
+            shots = [await capture_shot()]
+            deadline = loop.time() + BATCH_S
+            while True:                  # agrupa toggles da janela (ex.: duas páginas)
+                restante = deadline - loop.time()
+                if restante <= 0: break
+                try: await asyncio.wait_for(events.get(), restante)
+                except asyncio.TimeoutError: break
+                print("🔔 Mais um toggle — foto adicional…")
+                shots.append(await capture_shot())
+            await process_once(shots)
+            while not events.empty():    # ignora bordas durante o processamento
+                events.get_nowait()
     finally:
-        GPIO.cleanup()
+        cb.cancel(); await http.close(); cleanup()
 
 if __name__ == "__main__":
-    signal.signal(signal.SIGTERM, lambda *_: GPIO.cleanup())
-    main()
+    signal.signal(signal.SIGTERM, lambda *_: cleanup())
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass